@@ -21,6 +21,7 @@ import ContactUs from '@/components/ContactUs';
 import AboutUs from '@/components/AboutUs';
 import Footer from '@/components/Footer';
 import LoadingLines from '@/components/ui/loading-lines';
+import { imageVariant, imageSrcSet } from '@/lib/utils';
 
 import '@/App.css';
 
@@ -637,8 +638,11 @@ const ProductsPage = ({ clerkUser, user, token, toast, cart, setCart, fetchCart,
             <Card className="h-full flex flex-col">
               <div className="relative">
                 <img
-                  src={product.image_url}
+                  src={imageVariant(product.image_url, 'card')}
+                  srcSet={imageSrcSet(product.image_url)}
+                  sizes="(min-width: 768px) 33vw, 100vw"
                   alt={product.name}
+                  loading="lazy"
                   className="w-full h-48 object-cover rounded-t-lg"
                 />
                 {product.category === 'course' && (
@@ -797,7 +801,7 @@ const ProductDetailPage = ({ clerkUser, user, token, toast, cart, setCart, fetch
           <div>
             {!product.video_url && (
               <img
-                src={product.image_url}
+                src={imageVariant(product.image_url, 'detail')}
                 alt={product.name}
                 className="w-full rounded-lg shadow-lg"
               />
@@ -805,7 +809,7 @@ const ProductDetailPage = ({ clerkUser, user, token, toast, cart, setCart, fetch
             {product.video_url && product.category === 'software' && (
               <div>
                 <img
-                  src={product.image_url}
+                  src={imageVariant(product.image_url, 'detail')}
                   alt={product.name}
                   className="w-full rounded-lg shadow-lg mb-6"
                 />
@@ -1038,7 +1042,9 @@ const CartPage = ({ clerkUser, user, token, toast, cart, setCart, fetchCart, set
                 <Card>
                   <CardContent className="flex flex-col sm:flex-row items-start sm:items-center gap-4 p-4">
                     <img
-                      src={item.product.image_url}
+                      src={imageVariant(item.product.image_url, 'card')}
+                      srcSet={imageSrcSet(item.product.image_url)}
+                      sizes="(min-width: 640px) 96px, 100vw"
                       alt={item.product.name}
                       className="w-full sm:w-24 h-32 sm:h-24 object-cover rounded"
                     />
@@ -1456,7 +1462,7 @@ const AdminDashboard = ({ user, token, toast }) => {
             {products.map((product) => (
               <div key={product.id} className="flex items-center gap-4 p-4 border rounded-lg">
                 {product.image_url && (
-                  <img src={product.image_url} alt={product.name} className="w-20 h-20 object-cover rounded" />
+                  <img src={imageVariant(product.image_url, 'thumb')} alt={product.name} className="w-20 h-20 object-cover rounded" />
                 )}
                 <div className="flex-grow">
                   <h3 className="font-semibold">{product.name}</h3>
@@ -4,3 +4,41 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs) {
   return twMerge(clsx(inputs));
 }
+
+// Fixed set of Cloudinary delivery variants. Cloudinary derives each one on
+// first request and caches it on its CDN, so views never re-transform.
+// Only `thumb` crops; the others keep the original aspect ratio and leave
+// cropping to object-cover, since the same box changes shape across breakpoints.
+const IMAGE_VARIANTS = {
+  thumb: "c_fill,w_192,h_192,f_auto,q_auto",
+  card: "c_limit,w_800,f_auto,q_auto",
+  detail: "c_limit,w_1200,f_auto,q_auto",
+};
+
+// Widths offered in srcSet so each screen picks the smallest sufficient file.
+const SRCSET_WIDTHS = [400, 800, 1200];
+
+function isCloudinaryImage(url) {
+  return Boolean(url) && url.includes("res.cloudinary.com") && url.includes("/image/upload/");
+}
+
+function withTransform(url, transform) {
+  return url.replace("/image/upload/", `/image/upload/${transform}/`);
+}
+
+export function imageVariant(url, variant) {
+  const transform = IMAGE_VARIANTS[variant];
+  if (!transform || !isCloudinaryImage(url)) {
+    return url;
+  }
+  return withTransform(url, transform);
+}
+
+export function imageSrcSet(url) {
+  if (!isCloudinaryImage(url)) {
+    return undefined;
+  }
+  return SRCSET_WIDTHS
+    .map((width) => `${withTransform(url, `c_limit,w_${width},f_auto,q_auto`)} ${width}w`)
+    .join(", ");
+}